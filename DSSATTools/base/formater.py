@@ -1,5 +1,6 @@
 
 import fortranformat as ff
+import numpy as np
 from pandas import isna
 
 
@@ -63,4 +64,14 @@ def weather_data(fields):
     fmt = f'A7,{len(fields)}(1X,F5.1)'
     return ff.FortranRecordWriter(fmt).write(fields) + '\n'
 
-
+# Vectorized version of weather_data for a block of rows. The row format is
+# built once for the number of columns and the whole block is formatted in a
+# single call.
+def weather_data_lines(days, values):
+    values = np.asarray(values)
+    nrows, ncols = values.shape
+    row_fmt = '%s' + ncols*' %5.1f' + '\n'
+    fields = np.empty((nrows, ncols + 1), dtype=object)
+    fields[:, 0] = days
+    fields[:, 1:] = values
+    return (row_fmt * nrows) % tuple(fields.ravel().tolist())
@@ -42,9 +42,9 @@ for the weather instance created in the previous example:
 import os
 import pandas as pd
 from pandas import DataFrame
-from datetime import datetime
 from pandas import NA, isna
-from DSSATTools.base.formater import weather_data, weather_data_header, weather_station
+from DSSATTools.base.formater import weather_data, weather_data_header, \
+    weather_station, weather_data_lines
 
 PARS_DESC = {
     # Station parameters
@@ -72,6 +72,7 @@ PARS_DESC = {
 PARS_STATION = ['INSI', 'LAT', 'LONG', 'ELEV', 'TAV', 'AMP', 'REFHT', 'WNDHT', "CO2"]
 PARS_DATA = [i for i in PARS_DESC.keys() if i not in PARS_STATION]
 MANDATORY_DATA = ['TMIN', 'TMAX', 'RAIN', 'SRAD']
+CHUNK_SIZE = 1000 # Rows formatted and written at a time
 
 def list_station_parameters():
     '''
@@ -132,47 +133,40 @@ class Weather():
         self.AMP = amp 
         self.REFHT = refht
         self.WNDHT = wndht
-        data = df.copy()
         self.CO2 = co2
         
-        cols = []
-        for key, value in pars.items():
+        for value in pars.values():
             assert value in PARS_DATA, \
                 f'{value} is not a valid variable name'
-            if (value in PARS_DATA):
-                data[value] = data[key]
-                cols.append(value)
-                if (key not in PARS_DATA):
-                    data.drop(columns=[key], inplace=True)
-        data = data[cols]
+        data = df[list(pars.keys())].rename(columns=pars)
 
 
         assert all(map(lambda x: x in data.columns, MANDATORY_DATA)), \
             f'Data must contain at least {", ".join(MANDATORY_DATA)} variables'
 
         # A really quick QC check
-        TEMP_QC = all(data.TMIN <= data.TMAX)
-        assert TEMP_QC, 'TMAX < TMIN at some point in the series'
+        tmin = data['TMIN'].to_numpy()
+        tmax = data['TMAX'].to_numpy()
+        assert (tmin <= tmax).all(), 'TMAX < TMIN at some point in the series'
         if 'RHUM' in data.columns:
-            RHUM_QC = all((data.RHUM >= 0) & (data.RHUM <= 100))
-            assert RHUM_QC, '0 <= RHUM <= 100 must be accomplished'
-        RAIN_QC = all(data.RAIN >= 0)
-        assert RAIN_QC, '0 <= RAIN must be accomplished'
-        if 'SRAD' in data.columns:
-            SRAD_QC = all(data.SRAD >= 0)
-            assert SRAD_QC, '0 <= SRAD must be accomplished'
+            rhum = data['RHUM'].to_numpy()
+            assert ((rhum >= 0) & (rhum <= 100)).all(), \
+                '0 <= RHUM <= 100 must be accomplished'
+        rain = data['RAIN'].to_numpy()
+        assert (rain >= 0).all(), '0 <= RAIN must be accomplished'
+        srad = data['SRAD'].to_numpy()
+        assert (srad >= 0).all(), '0 <= SRAD must be accomplished'
 
         # Check date column
-        DATE_COL = False
-        for col in data.columns:
-            if pd.api.types.is_datetime64_any_dtype(data[col]):
-                DATE_COL = col
         if pd.api.types.is_datetime64_any_dtype(data.index):
             DATE_COL = True
+        else:
+            dt_cols = data.select_dtypes(include=['datetime', 'datetimetz']).columns
+            DATE_COL = dt_cols[-1] if len(dt_cols) else False
         assert DATE_COL, 'At least one of the data columns must be a date'
 
         if isinstance(DATE_COL, str):
-            data.set_index(DATE_COL, inplace=True)
+            data = data.set_index(DATE_COL)
         
         self.INSI = self.INSI[:4].upper()
 
@@ -193,32 +187,33 @@ class Weather():
         ----------
         folder: str
             Path to the folder the files will be saved.
+        management: Management
+            Accepted for compatibility, but ignored. The whole series is
+            written, as DSSAT fails if the simulation start is not later than
+            the first weather date.
             
         '''
-        if not os.path.exists(folder):
-            os.mkdir(folder)
-        man = kwargs.get('management', False)
-        if man:
-            sim_start = datetime(man.sim_start.year, man.sim_start.month, man.sim_start.day)
-            # self.data = self.data.loc[self.data.index >= sim_start]
+        os.makedirs(folder or '.', exist_ok=True)
 
         filename = f'{self._name}.WTH'
-        outstr = f'$WEATHER DATA : {self.description}\n\n'
-        outstr += '@ INSI      LAT     LONG  ELEV   TAV   AMP REFHT WNDHT  CCO2\n'
-        outstr += weather_station([
-            self.INSI, self.LAT, self.LON, self.ELEV,
-            self.TAV, self.AMP, self.REFHT, self.WNDHT,
-            self.CO2
+        preamble = "".join([
+            f'$WEATHER DATA : {self.description}\n\n',
+            '@ INSI      LAT     LONG  ELEV   TAV   AMP REFHT WNDHT  CCO2\n',
+            weather_station([
+                self.INSI, self.LAT, self.LON, self.ELEV,
+                self.TAV, self.AMP, self.REFHT, self.WNDHT,
+                self.CO2
+            ]),
+            weather_data_header(self.data.columns)
         ])
-        outstr += weather_data_header(self.data.columns)
 
-        df = self.data.map(lambda x: f"{x:5.1f}")
-        df['day'] = df.index.strftime("%Y%j")
-        df = df [["day"]+list(self.data.columns)]
-        outstr += "\n".join(map(lambda x: " ".join(x), df.values))
-        
-        with open(os.path.join(folder, filename), 'w') as f:
-            f.write(outstr)
+        values = self.data.to_numpy(dtype=float)
+        doy_strs = self.data.index.strftime("%Y%j").to_numpy()
+        with open(os.path.join(folder, filename), 'w', buffering=1024*1024) as f:
+            f.write(preamble)
+            for a in range(0, len(values), CHUNK_SIZE):
+                b = a + CHUNK_SIZE
+                f.write(weather_data_lines(doy_strs[a:b], values[a:b]))
 
     def __repr__(self):
         repr_str = f"Weather data at {self.LON:.3f}°, {self.LAT:.3f}°\n"
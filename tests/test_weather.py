@@ -1,6 +1,7 @@
 from pyparsing import col
 import pytest
 from DSSATTools import Weather, SoilProfile, DSSAT, Management, Crop
+from DSSATTools.base.formater import weather_data_lines
 from datetime import datetime
 import pandas as pd
 import numpy as np
@@ -39,6 +40,53 @@ class TestWeather:
         assert os.path.exists(folder)
         assert os.path.exists(os.path.join(folder, f'WSTA0011.WTH'))
 
+    def test_write_output(self):
+        folder = os.path.join(PROJECT_ROOT, 'tests', 'wth_test')
+        if os.path.exists(folder): shutil.rmtree(folder)
+        wth = Weather(
+            pd.DataFrame({
+                'TMIN': [12.34, 15., 9.96], 'TMAX': [25.05, 30.5, 21.],
+                'RAIN': [0., 112.4, 3.25], 'SRAD': [18.2, 7.5, 22.],
+            }, index=pd.to_datetime(['2000-12-31', '2000-12-30', '2001-01-01'])),
+            {"TMIN": "TMIN", "TMAX": "TMAX", 
+             "RAIN": "RAIN", "SRAD": "SRAD"},
+            4.54, -75.1, 1800
+        )
+        wth.write(folder)
+        with open(os.path.join(folder, 'WSTA0002.WTH'), 'r') as f:
+            assert f.read() == (
+                '$WEATHER DATA : Weather station\n'
+                '\n'
+                '@ INSI      LAT     LONG  ELEV   TAV   AMP REFHT WNDHT  CCO2\n'
+                '  WSTA    4.540  -75.100  1800   -99   -99   -99   -99      \n'
+                '@  DATE  TMIN  TMAX  RAIN  SRAD\n'
+                '2000365  15.0  30.5 112.4   7.5\n'
+                '2000366  12.3  25.1   0.0  18.2\n'
+                '2001001  10.0  21.0   3.2  22.0\n'
+            )
+
+    def test_write_after_data_change(self):
+        folder = os.path.join(PROJECT_ROOT, 'tests', 'wth_test')
+        if os.path.exists(folder): shutil.rmtree(folder)
+        wth = Weather(df, variables, 4.54, -75.1, 1800)
+        wth.data = wth.data.loc['2000-06-01':]
+        wth.write(folder)
+        with open(os.path.join(folder, f'WSTA0011.WTH'), 'r') as f:
+            lines = f.readlines()
+        data_lines = lines[lines.index(
+            next(l for l in lines if l.startswith('@  DATE'))
+        ) + 1:]
+        assert len(data_lines) == len(wth.data)
+        assert data_lines[0].startswith('2000153')
+        # Columns changed after init
+        wth.data = wth.data[['TMIN', 'TMAX', 'RAIN', 'SRAD']]
+        wth.write(folder)
+        with open(os.path.join(folder, f'WSTA0011.WTH'), 'r') as f:
+            lines = f.readlines()
+        header = next(l for l in lines if l.startswith('@  DATE'))
+        assert header.split() == ['@', 'DATE', 'TMIN', 'TMAX', 'RAIN', 'SRAD']
+        assert len(lines[-1].split()) == 5
+
     def test_wrong_variable_map(self):
         with pytest.raises(AssertionError) as excinfo:
             Weather(df, {
@@ -156,3 +204,27 @@ class TestWeather:
             soil, wth, crop, man
         )
         assert np.isclose(dssat.output["Weather"]["CO2D"].iloc[0], 500., atol=1)
+
+
+class TestWeatherDataLines:
+    def test_fixed_width(self):
+        lines = weather_data_lines(
+            np.array(['2000001', '2000002']),
+            np.array([[1.25, 0.], [-12.34, 100.]])
+        )
+        assert lines == '2000001   1.2   0.0\n2000002 -12.3 100.0\n'
+        assert all(len(l) == 19 for l in lines.splitlines())
+
+    def test_nan(self):
+        lines = weather_data_lines(['2000001'], np.array([[np.nan, 3.]]))
+        assert lines == '2000001   nan   3.0\n'
+
+    def test_wide_values(self):
+        lines = weather_data_lines(['2000001'], np.array([[1234.56, -100.]]))
+        assert lines == '2000001 1234.6 -100.0\n'
+
+    def test_trailing_newline(self):
+        lines = weather_data_lines(['2000001'], np.array([[1., 2.]]))
+        assert lines.endswith('\n')
+        assert not lines.endswith('\n\n')
+        assert weather_data_lines([], np.empty((0, 2))) == ''